@@ -0,0 +1,88 @@
+import base64
+import binascii
+import hashlib
+import json
+
+default_page_size = 50
+max_page_size = 200
+
+class InvalidCursorError(ValueError):
+    pass
+
+class MovieCatalog:
+    # Struct-of-arrays view of the movie list: one tuple per column instead of
+    # one Pydantic object per movie, so pages are plain slices and nothing here
+    # can be mutated by request handlers.
+    __slots__ = ('ids', 'titles', 'titles_lower', 'version', '_pages')
+
+    def __init__(self, ids, titles):
+        self.ids = tuple(str(movie_id) for movie_id in ids)
+        self.titles = tuple(str(title) for title in titles)
+        self.titles_lower = tuple(title.lower() for title in self.titles)
+        digest = hashlib.sha1()
+        for movie_id, title in zip(self.ids, self.titles):
+            digest.update(f"{movie_id}\0{title}\0".encode())
+        self.version = digest.hexdigest()[:12]
+
+        # Precompute serialized bytes and ETags for every unfiltered page of the default size
+        self._pages = {}
+        for start in range(0, len(self.ids), default_page_size):
+            self._pages[start] = self._render(range(start, min(start + default_page_size, len(self.ids))), "")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def encode_cursor(self, position, q):
+        raw = json.dumps([self.version, position, q], separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor, q):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            version, position, cursor_q = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidCursorError("Malformed cursor")
+        if version != self.version:
+            raise InvalidCursorError("Cursor refers to a different catalog version")
+        if cursor_q != q or not isinstance(position, int) or not 0 <= position <= len(self.ids):
+            raise InvalidCursorError("Cursor does not match this query")
+        return position
+
+    def page(self, cursor=None, q=None, size=default_page_size):
+        # Return (body bytes, ETag) for one page, starting after the given cursor
+        q = (q or "").lower()
+        start = self.decode_cursor(cursor, q) if cursor else 0
+
+        if not q:
+            if size == default_page_size and start in self._pages:
+                return self._pages[start]
+            return self._render(range(start, min(start + size, len(self.ids))), q)
+
+        # Scan only as far as needed to fill the page (plus one to know if more remain)
+        indices = []
+        position = start
+        while position < len(self.titles_lower) and len(indices) <= size:
+            if q in self.titles_lower[position]:
+                indices.append(position)
+            position += 1
+        return self._render(indices, q, size)
+
+    def _render(self, indices, q, size=None):
+        indices = list(indices)
+        if size is None:
+            next_position = indices[-1] + 1 if indices and indices[-1] + 1 < len(self.ids) else None
+        else:
+            next_position = indices[size] if len(indices) > size else None
+            indices = indices[:size]
+        body = json.dumps({
+            "items": [{"id": self.ids[i], "title": self.titles[i], "posterPath": ""} for i in indices],
+            "nextCursor": self.encode_cursor(next_position, q) if next_position is not None else None,
+        }, separators=(',', ':')).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        return body, etag
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
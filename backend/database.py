@@ -6,6 +6,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from dotenv import load_dotenv
 import tensorflow as tf
 from models import MovieModel
+from catalog import MovieCatalog
 
 # Load environment variables from .env file
 load_dotenv()
@@ -21,6 +22,7 @@ movies_df = pd.read_csv('data/ml-20m/movies.csv')
 for _, row in movies_df.iterrows():
     movie_instance = MovieModel(id=str(row['movieId']), title=row['title'], posterPath="")
     movies.append(movie_instance)
+catalog = MovieCatalog(movies_df['movieId'], movies_df['title'])
 ratings_df = pd.read_csv('data/ml-20m/ratings.csv')
 tags_df = pd.read_csv('data/ml-20m/tags.csv')
 links_df = pd.read_csv('data/ml-20m/links.csv')
@@ -1,9 +1,10 @@
 from typing import Union
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header, Query, Response
 from fastapi_pagination import Page, paginate
 from models import RecommendationRequest, MovieModel
-from database import movies, movie_to_tmdb_map, model, tfidf_matrix, movie_index_mapping, movies_with_tags, movie_id_mapping
+from database import movies, catalog, movie_to_tmdb_map, model, tfidf_matrix, movie_index_mapping, movies_with_tags, movie_id_mapping
 from utils import get_poster_path
+from catalog import InvalidCursorError, default_page_size, max_page_size, etag_matches
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
@@ -15,8 +16,8 @@ def get_movie(movie_id: str):
     movie = next((movie for movie in movies if movie.id == movie_id), None)
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
-    movie.posterPath = get_poster_path(movie_id, movie_to_tmdb_map)
-    return movie
+    # Return a copy so the shared catalog entry is never mutated by a request
+    return movie.copy(update={"posterPath": get_poster_path(movie_id, movie_to_tmdb_map)})
 
 @api_router.get('/movies', response_model=Page[MovieModel], summary="Get all movies", description="Fetch all movies or search for a movie by its title.")
 def get_movies(q: Union[str, None] = None) -> Page[MovieModel]:
@@ -26,6 +27,21 @@ def get_movies(q: Union[str, None] = None) -> Page[MovieModel]:
         return paginate(filtered_movies)
     return paginate(movies)
 
+@api_router.get('/catalog', summary="Stream the movie catalog", description="Fetch movies page by page using opaque cursors. Supports conditional requests via ETag / If-None-Match.")
+def get_catalog(
+    q: Union[str, None] = None,
+    cursor: Union[str, None] = None,
+    size: int = Query(default_page_size, ge=1, le=max_page_size),
+    if_none_match: Union[str, None] = Header(None),
+):
+    try:
+        body, etag = catalog.page(cursor=cursor, q=q, size=size)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 # Content-Based Filtering using TF-IDF
 def get_content_based_recommendations(user_ratings, num_recommendations=10):
     rated_movie_indices = [movie_index_mapping[movie_id] for movie_id in user_ratings]
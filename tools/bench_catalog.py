@@ -0,0 +1,89 @@
+import os
+import json
+import sys
+import time
+import pandas as pd
+from typing import Union
+from fastapi import FastAPI, Header, Query, Response
+from fastapi.testclient import TestClient
+from fastapi_pagination import Page, paginate, add_pagination
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_script_dir.rsplit('/', 1)[0] + '/backend')
+
+from catalog import MovieCatalog, default_page_size, max_page_size, etag_matches
+from pydantic import BaseModel
+
+# Same shape as models.MovieModel, redeclared so the benchmark does not import tensorflow
+class MovieModel(BaseModel):
+    id: str
+    title: str
+    posterPath: str
+
+movies_df = pd.read_csv(current_script_dir.rsplit('/', 1)[0] + '/data/ml-20m/movies.csv')
+movies = [MovieModel(id=str(row['movieId']), title=row['title'], posterPath="") for _, row in movies_df.iterrows()]
+catalog = MovieCatalog(movies_df['movieId'], movies_df['title'])
+
+# Current implementation of /movies
+paginated_app = FastAPI()
+
+@paginated_app.get('/movies', response_model=Page[MovieModel])
+def get_movies(q: Union[str, None] = None) -> Page[MovieModel]:
+    if q:
+        filtered_movies = [movie for movie in movies if q.lower() in movie.title.lower()]
+        return paginate(filtered_movies)
+    return paginate(movies)
+
+add_pagination(paginated_app)
+
+# Cursor-based /catalog
+catalog_app = FastAPI()
+
+@catalog_app.get('/catalog')
+def get_catalog(
+    q: Union[str, None] = None,
+    cursor: Union[str, None] = None,
+    size: int = Query(default_page_size, ge=1, le=max_page_size),
+    if_none_match: Union[str, None] = Header(None),
+):
+    body, etag = catalog.page(cursor=cursor, q=q, size=size)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def requests_per_second(client, urls, headers=None, duration=3.0):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        client.get(urls[count % len(urls)], headers=headers)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def catalog_urls(q=None, pages=20):
+    # Walk the first pages through their cursors, as a client would
+    urls = []
+    cursor = None
+    for _ in range(pages):
+        url = f"/catalog?size={default_page_size}" + (f"&q={q}" if q else "") + (f"&cursor={cursor}" if cursor else "")
+        urls.append(url)
+        body, _ = catalog.page(cursor=cursor, q=q, size=default_page_size)
+        cursor = json.loads(body)['nextCursor']
+        if not cursor:
+            break
+    return urls
+
+paginated_client = TestClient(paginated_app)
+catalog_client = TestClient(catalog_app)
+_, first_etag = catalog.page()
+
+print(f"Movies in catalog: {len(catalog)}")
+print(f"{'scenario':<28}{'/movies':>12}{'/catalog':>12}")
+scenarios = [
+    ("unfiltered, first pages", [f"/movies?page={p}&size={default_page_size}" for p in range(1, 21)], catalog_urls(), None),
+    ("title search 'love'", [f"/movies?q=love&page={p}&size={default_page_size}" for p in range(1, 4)], catalog_urls("love", 3), None),
+    ("conditional GET (304)", [f"/movies?page=1&size={default_page_size}"], ["/catalog"], {"If-None-Match": first_etag}),
+]
+for name, movies_urls, catalog_url_list, catalog_headers in scenarios:
+    old = requests_per_second(paginated_client, movies_urls)
+    new = requests_per_second(catalog_client, catalog_url_list, headers=catalog_headers)
+    print(f"{name:<28}{old:>12.0f}{new:>12.0f}")